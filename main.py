@@ -1020,8 +1020,12 @@ def main():
     parser.add_argument("--test", action="store_true", help="快速测试模式")
     parser.add_argument("--config", type=str, default=str(CONFIG_PATH), help="配置文件路径")
     args = parser.parse_args()
-    
+
     setup_logging()
+
+    # 可选加速：uvloop 对批量推送这类协程密集场景基本是免费提速
+    from utils import install_uvloop
+    install_uvloop()
     
     if args.reset_xp:
         from database import reset_xp_data, init_db
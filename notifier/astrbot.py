@@ -7,10 +7,23 @@ import logging
 import json
 import base64
 import io
+import tempfile
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Callable, Optional
 
 import aiohttp
 
+try:
+    import pybase64  # SIMD 加速的 base64，编码大图快一个数量级
+except ImportError:
+    pybase64 = None
+
+try:
+    import orjson  # C 实现的 JSON，序列化大 base64 payload 快 3-10 倍
+except ImportError:
+    orjson = None
+
 from .base import BaseNotifier
 
 if TYPE_CHECKING:
@@ -18,6 +31,51 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# 小于此体积且尺寸达标的 JPEG 直接透传，不再解码重压（二次有损只会更大更糊）
+_JPEG_PASSTHROUGH_MAX_BYTES = 2 * 1024 * 1024
+
+
+def _b64encode_str(data) -> str:
+    """Base64 编码为 str（优先 pybase64，未安装则回退标准库）"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode()
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """JSON 序列化为 bytes（优先 orjson，未安装则回退标准库）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+class _ImageCache:
+    """URL -> Base64 的 LRU 缓存，按总字节数限容（而非条数）"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._data: OrderedDict[str, str] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, url: str) -> str | None:
+        value = self._data.get(url)
+        if value is not None:
+            self._data.move_to_end(url)
+        return value
+
+    def put(self, url: str, value: str):
+        if len(value) > self.max_bytes:
+            return
+        old = self._data.pop(url, None)
+        if old is not None:
+            self._total_bytes -= len(old)
+        self._data[url] = value
+        self._total_bytes += len(value)
+        # 超容则从最久未用端逐出
+        while self._total_bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
 
 class AstrBotNotifier(BaseNotifier):
     """AstrBot HTTP API 推送器"""
@@ -30,9 +88,17 @@ class AstrBotNotifier(BaseNotifier):
         on_feedback: Optional[Callable] = None,
         on_action: Optional[Callable] = None,
         client: Optional['PixivClient'] = None,
+        session: Optional[aiohttp.ClientSession] = None,
         max_pages: int = 10,
         image_quality: int = 85,
-        max_image_size: int = 1500
+        max_image_size: int = 1500,
+        concurrency: int = 4,
+        send_interval: float = 1.0,
+        resample: Optional[int] = None,
+        progressive: bool = True,
+        subsampling: int = 2,
+        dynamic_quality: bool = True,
+        max_payload_bytes: int = 10 * 1024 * 1024
     ):
         """
         初始化 AstrBot 推送器
@@ -44,9 +110,22 @@ class AstrBotNotifier(BaseNotifier):
             on_feedback: 反馈回调函数
             on_action: 动作回调函数
             client: PixivClient 实例 (用于下载图片)
+            session: 外部共享的 aiohttp 会话（未提供时复用 client 的，
+                都没有才自建；只有自建的会话才会在 close() 时关闭）
             max_pages: 多图作品最大页数
             image_quality: JPEG 压缩质量
             max_image_size: 图片最大边长
+            concurrency: 并发处理的作品数（下载+发送）
+            send_interval: 两次 POST 之间的最小间隔（秒），全局生效
+            resample: 缩放滤镜 (PIL.Image.Resampling)，默认 BICUBIC。
+                输出只是聊天缩略图，BICUBIC 与 LANCZOS 视觉无差但快 2-4 倍
+            progressive: 渐进式 JPEG，照片类内容可再省 10-20% 体积
+            subsampling: JPEG 色度抽样 (0=4:4:4, 1=4:2:2, 2=4:2:0)。
+                线稿/文字类作品对色度敏感时可设为 0
+            dynamic_quality: 动态质量，从 image_quality 逐级降质直到
+                体积收益 <2%（简单作品可省 15-30%，复杂作品保持原质量）
+            max_payload_bytes: 单图 base64 后的体积上限，超限时降质重编码，
+                避免压缩完才被 AstrBot 侧 POST 限制打回
         """
         self.http_url = http_url.rstrip('/')
         self.unified_msg_origin = unified_msg_origin
@@ -57,21 +136,72 @@ class AstrBotNotifier(BaseNotifier):
         self.max_pages = max_pages
         self.image_quality = image_quality
         self.max_image_size = max_image_size
-        
+        self.concurrency = concurrency
+        self.send_interval = send_interval
+        self.resample = resample
+        self.progressive = progressive
+        self.subsampling = subsampling
+        self.dynamic_quality = dynamic_quality
+        self.max_payload_bytes = max_payload_bytes
+
         self._session: Optional[aiohttp.ClientSession] = None
+        self._external_session = session
+        self._owns_session = False
+        # 预构建请求头（会话可能是共享的，不能依赖 session 默认头）
+        self._request_headers = {"Content-Type": "application/json"}
+        if api_key:
+            self._request_headers["Authorization"] = f"Bearer {api_key}"
         self._message_illust_map: dict[int, int] = {}  # msg_id -> illust_id
+        self._send_lock = asyncio.Lock()
+        self._last_send_time = 0.0
+        self._image_cache = _ImageCache()
+        self._batch_supported: Optional[bool] = None  # None=未探测
+
+        # 预编译消息模板（format_message 在发送热路径上逐作品调用）
+        body = (
+            "{long_mark}{r18_mark}{ugoira_mark}🎨 {title}{page_info}\n"
+            "👤 {user_name}\n"
+            "❤️ {bookmark_count}\n"
+            "{match_line}"
+            "🏷️ {tags}\n"
+            "🔗 https://pixiv.net/i/{id}\n\n"
+            "回复 {id} 1=喜欢 2=不喜欢"
+        )
+        self._text_template = body.replace("{match_line}", "")
+        self._text_template_match = body.replace(
+            "{match_line}", "🎯 匹配度: {match_pct:.0f}%\n"
+        )
         
         logger.info(f"AstrBot 推送目标: {unified_msg_origin}")
     
     async def _ensure_session(self):
-        """确保 HTTP session 已创建"""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-    
+        """确保 HTTP session 已创建（优先复用外部/PixivClient 的会话）"""
+        if self._session is not None and not self._session.closed:
+            return
+
+        # 复用外部会话：共享连接池、DNS 缓存与 TLS 上下文
+        if self._external_session is not None and not self._external_session.closed:
+            self._session = self._external_session
+            self._owns_session = False
+            return
+        if self.client is not None:
+            self._session = self.client.get_session()
+            self._owns_session = False
+            return
+
+        # 自建会话，连接池调优与 PixivClient 共用同一配置
+        from utils import create_tuned_connector
+        self._session = aiohttp.ClientSession(
+            connector=create_tuned_connector(),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        self._owns_session = True
+
     async def close(self):
-        """关闭连接"""
-        if self._session and not self._session.closed:
+        """关闭连接（共享会话由其所有者负责关闭）"""
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
+        self._session = None
     
     async def _post_message(self, message_chain: list) -> dict | None:
         """
@@ -92,12 +222,14 @@ class AstrBotNotifier(BaseNotifier):
             "message": message_chain
         }
         
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        
+        # 自行序列化：避免 aiohttp json= 路径里 stdlib dumps 对大 base64 的
+        # 单线程慢编码和中间 str 拷贝
+        body = _json_dumps_bytes(payload)
+
         try:
-            async with self._session.post(url, json=payload, headers=headers, timeout=30) as resp:
+            async with self._session.post(
+                url, data=body, headers=self._request_headers, timeout=30
+            ) as resp:
                 if resp.status == 200:
                     result = await resp.json()
                     logger.debug(f"AstrBot 消息发送成功: {result}")
@@ -113,121 +245,401 @@ class AstrBotNotifier(BaseNotifier):
             logger.error("AstrBot 请求超时")
             return None
     
-    async def _download_and_encode_image(self, url: str) -> str | None:
-        """下载图片并转为 Base64"""
+    async def _post_messages_batch(self, chains: list[list]) -> list | None:
+        """
+        通过批量端点一次 POST 发送多条消息链
+
+        Returns:
+            逐条结果列表；端点不存在或请求失败时返回 None（调用方回退逐条发送）
+        """
+        await self._ensure_session()
+
+        url = f"{self.http_url}/api/v1/send_batch"
+
+        payload = {
+            "messages": [
+                {"unified_msg_origin": self.unified_msg_origin, "message": chain}
+                for chain in chains
+            ]
+        }
+        body = _json_dumps_bytes(payload)
+
         try:
-            from utils import download_image_with_referer
-            from PIL import Image
-            
-            await self._ensure_session()
-            image_data = await download_image_with_referer(self._session, url)
-            
-            if not image_data:
+            async with self._session.post(
+                url, data=body, headers=self._request_headers, timeout=60
+            ) as resp:
+                if resp.status == 404:
+                    # 插件未提供批量端点，记住结论避免每次探测
+                    logger.info("AstrBot 不支持批量发送端点，回退逐条发送")
+                    self._batch_supported = False
+                    return None
+                if resp.status == 200:
+                    result = await resp.json()
+                    self._batch_supported = True
+                    logger.debug(f"AstrBot 批量发送成功: {len(chains)} 条")
+                    results = result.get("results")
+                    if isinstance(results, list) and len(results) == len(chains):
+                        return results
+                    # 无逐条结果时视为整批成功，但不能拿同一份响应给每个作品
+                    # 记 message_id（会把反馈/链式回复错误归因到最后一个作品）
+                    return [True] * len(chains)
+                text = await resp.text()
+                logger.error(f"AstrBot 批量发送失败 [{resp.status}]: {text}")
                 return None
-            
-            # 压缩处理
-            with Image.open(io.BytesIO(image_data)) as img:
-                # 处理透明度
-                if img.mode == 'P':
+        except aiohttp.ClientError as e:
+            logger.error(f"AstrBot 批量请求失败: {e}")
+            return None
+        except asyncio.TimeoutError:
+            logger.error("AstrBot 批量请求超时")
+            return None
+
+    async def _fetch_to_spool(self, url: str) -> tempfile.SpooledTemporaryFile | None:
+        """
+        流式下载图片到 SpooledTemporaryFile
+        小图（<2MB）留在内存，大图溢出到磁盘，避免 30MB 原图整份驻留 RAM
+        """
+        from utils import download_image_to_file_with_referer
+
+        await self._ensure_session()
+        spool = tempfile.SpooledTemporaryFile(max_size=2 << 20)
+        try:
+            size = await download_image_to_file_with_referer(self._session, url, spool)
+        except Exception:
+            spool.close()
+            raise
+
+        if not size:
+            spool.close()
+            return None
+        spool.seek(0)
+        return spool
+
+    def _compress_sync(self, spool) -> str:
+        """压缩图片并转为 Base64（CPU 密集，需在线程池中运行）"""
+        from PIL import Image
+
+        spool.seek(0, io.SEEK_END)
+        raw_size = spool.tell()
+        spool.seek(0)
+
+        # Pillow 直接从文件句柄惰性读取，配合 draft 无需整图进内存
+        with Image.open(spool) as img:
+            # 快路径：已是尺寸/体积达标的 JPEG，直接透传原始字节
+            # （Image.open 惰性解码，读 size/format 不触发完整 decode）
+            if (
+                img.format == 'JPEG'
+                and max(img.size) <= self.max_image_size
+                and raw_size <= _JPEG_PASSTHROUGH_MAX_BYTES
+                and raw_size * 4 // 3 <= self.max_payload_bytes
+            ):
+                spool.seek(0)
+                return _b64encode_str(spool.read())
+
+            # JPEG 源启用 draft 解码：libjpeg 按 1/2、1/4、1/8 缩放 IDCT，
+            # 大图不必解出全分辨率像素（非 JPEG 时是 no-op），之后
+            # thumbnail 仍做精确缩放
+            if max(img.size) > self.max_image_size:
+                img.draft('RGB', (self.max_image_size, self.max_image_size))
+
+            # 处理透明度
+            if img.mode == 'P':
+                if 'transparency' in img.info:
                     img = img.convert('RGBA')
-                if img.mode in ('RGBA', 'LA'):
-                    bg = Image.new('RGB', img.size, (255, 255, 255))
-                    bg.paste(img, mask=img.split()[-1])
-                    img = bg
-                elif img.mode != 'RGB':
+                else:
+                    # 无透明信息的调色板图（纯色底 PNG 常见）直接转 RGB，
+                    # 省掉 RGBA 中转的整幅分配 + 合成
                     img = img.convert('RGB')
-                
-                # 缩放
-                if max(img.size) > self.max_image_size:
-                    img.thumbnail((self.max_image_size, self.max_image_size), Image.Resampling.LANCZOS)
-                
-                # 压缩为 JPEG
+            if img.mode in ('RGBA', 'LA'):
+                # alpha_composite 全程在 C 里做白底合成，
+                # 比 split() 出 alpha 再 paste 少一次整幅通道拷贝
+                bg = Image.new('RGBA', img.size, (255, 255, 255, 255))
+                img = Image.alpha_composite(bg, img.convert('RGBA')).convert('RGB')
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # 缩放
+            resample = self.resample if self.resample is not None else Image.Resampling.BICUBIC
+            if max(img.size) > self.max_image_size:
+                img.thumbnail((self.max_image_size, self.max_image_size), resample)
+
+            # 压缩为 JPEG
+            if self.dynamic_quality:
+                output, encoded_quality = self._encode_dynamic_quality(img)
+            else:
                 output = io.BytesIO()
-                img.save(output, format="JPEG", quality=self.image_quality, optimize=True)
-                
-                return base64.b64encode(output.getvalue()).decode()
-                
+                self._save_jpeg(img, output, self.image_quality)
+                encoded_quality = self.image_quality
+
+            # 估算 base64 后体积 (×4/3)，超预算则继续降质，
+            # 避免压缩完才被服务端 POST 限制打回浪费一轮往返
+            if output.getbuffer().nbytes * 4 // 3 > self.max_payload_bytes:
+                final_quality = encoded_quality
+                # 从已达到的质量档往下走，不回头重编更高档
+                for quality in (75, 65, 55):
+                    if quality >= final_quality:
+                        continue
+                    output.seek(0)
+                    output.truncate()
+                    self._save_jpeg(img, output, quality)
+                    final_quality = quality
+                    if output.tell() * 4 // 3 <= self.max_payload_bytes:
+                        break
+
+                # 质量降到底仍超限：逐次减半尺寸重编码，保证不超预算
+                while (
+                    output.tell() * 4 // 3 > self.max_payload_bytes
+                    and max(img.size) > 64
+                ):
+                    img = img.resize(
+                        (max(1, img.width // 2), max(1, img.height // 2)),
+                        resample
+                    )
+                    output.seek(0)
+                    output.truncate()
+                    self._save_jpeg(img, output, final_quality)
+
+                logger.warning(
+                    f"AstrBot 图片超出 payload 预算，降至 q={final_quality} "
+                    f"{img.size} ({output.tell()} bytes)；如频繁出现请调低 max_image_size"
+                )
+
+            # getbuffer() 是零拷贝视图，直接喂给 base64 编码器，
+            # 避免 getvalue() 对 2-3MB JPEG 的整份拷贝
+            return _b64encode_str(output.getbuffer())
+
+    def _save_jpeg(self, img, output: io.BytesIO, quality: int):
+        """按当前配置编码 JPEG 到 output"""
+        img.save(
+            output,
+            format="JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=self.progressive,
+            subsampling=self.subsampling
+        )
+
+    def _encode_dynamic_quality(self, img) -> tuple[io.BytesIO, int]:
+        """
+        动态 JPEG 质量（jpeg-archive 启发式）：
+        从 image_quality 起每次降 5，只要相邻两档体积差 <2% 就停在高质量档。
+        简单/平涂类插画通常在低档就收敛，复杂作品保持高档。
+        两个缓冲区交替复用（seek+truncate），不随质量档数累积分配。
+
+        Returns:
+            (编码结果, 最终采用的质量档)
+        """
+        best = None
+        best_quality = self.image_quality
+        scratch = io.BytesIO()
+        for quality in range(self.image_quality, self.image_quality - 20, -5):
+            scratch.seek(0)
+            scratch.truncate()
+            self._save_jpeg(img, scratch, quality)
+
+            if best is not None and scratch.tell() > best.tell() * 0.98:
+                # 收益递减，保留上一档（质量更高）
+                break
+            best, scratch = scratch, (best if best is not None else io.BytesIO())
+            best_quality = quality
+
+        return best, best_quality
+
+    async def _download_and_encode_image(self, url: str) -> str | None:
+        """下载图片并转为 Base64（带 URL 级缓存）"""
+        # 重试/多通道分发时同一封面会被反复处理，缓存直接跳过下载+压缩
+        cached = self._image_cache.get(url)
+        if cached is not None:
+            logger.debug(f"AstrBot 图片缓存命中: {url}")
+            return cached
+
+        try:
+            spool = await self._fetch_to_spool(url)
+
+            if spool is None:
+                return None
+
+            try:
+                # PIL 解码/缩放/编码会阻塞事件循环几十到几百毫秒，丢到线程池
+                img_b64 = await asyncio.to_thread(self._compress_sync, spool)
+            finally:
+                spool.close()
+
+            self._image_cache.put(url, img_b64)
+            return img_b64
+
         except Exception as e:
             logger.warning(f"AstrBot 图片处理失败: {e}")
             return None
     
     def format_message(self, illust: 'Illust') -> str:
-        """格式化消息文本"""
-        tags = " ".join(f"#{t}" for t in illust.tags[:5])
-        r18_mark = "🔞 " if illust.is_r18 else ""
-        ugoira_mark = "🎞️ " if getattr(illust, 'type', 'illust') == 'ugoira' else ""
-        page_info = f" ({illust.page_count}P)" if illust.page_count > 1 else ""
-        
+        """格式化消息文本（模板在 __init__ 中预编译）"""
+        tag_list = illust.tags[:5]
+        fields = {
+            "long_mark": "📚 " if illust.page_count > self.max_pages else "",
+            "r18_mark": "🔞 " if illust.is_r18 else "",
+            "ugoira_mark": "🎞️ " if getattr(illust, 'type', 'illust') == 'ugoira' else "",
+            "title": illust.title,
+            "page_info": f" ({illust.page_count}P)" if illust.page_count > 1 else "",
+            "user_name": illust.user_name,
+            "bookmark_count": illust.bookmark_count,
+            "tags": "#" + " #".join(tag_list) if tag_list else "",
+            "id": illust.id,
+        }
+
         match_score = getattr(illust, 'match_score', None)
-        match_line = f"🎯 匹配度: {match_score*100:.0f}%\n" if match_score is not None else ""
-        
-        long_mark = "📚 " if illust.page_count > self.max_pages else ""
-        
-        return (
-            f"{long_mark}{r18_mark}{ugoira_mark}🎨 {illust.title}{page_info}\n"
-            f"👤 {illust.user_name}\n"
-            f"❤️ {illust.bookmark_count}\n"
-            f"{match_line}"
-            f"🏷️ {tags}\n"
-            f"🔗 https://pixiv.net/i/{illust.id}\n\n"
-            f"回复 {illust.id} 1=喜欢 2=不喜欢"
-        )
+        if match_score is not None:
+            fields["match_pct"] = match_score * 100
+            return self._text_template_match.format_map(fields)
+        return self._text_template.format_map(fields)
     
+    async def _throttle(self):
+        """全局发送限速：保证两次 POST 之间至少间隔 send_interval 秒"""
+        async with self._send_lock:
+            wait = self.send_interval - (time.monotonic() - self._last_send_time)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_send_time = time.monotonic()
+
+    async def _build_message_chain(self, illust: 'Illust') -> list[dict]:
+        """构建单个作品的消息链（图片 + 文本）"""
+        message_chain = []
+
+        # 1. 处理图片
+        if illust.image_urls:
+            # 多图作品只发送封面
+            cover_url = illust.image_urls[0]
+            img_b64 = await self._download_and_encode_image(cover_url)
+
+            if img_b64:
+                message_chain.append({
+                    "type": "Image",
+                    "base64": img_b64
+                })
+            else:
+                # 回退：使用 pixiv.cat 链接
+                from utils import get_pixiv_cat_url
+                cat_url = get_pixiv_cat_url(illust.id)
+                message_chain.append({
+                    "type": "Image",
+                    "url": cat_url
+                })
+
+        # 2. 添加文本
+        text = self.format_message(illust)
+        message_chain.append({
+            "type": "Plain",
+            "text": text
+        })
+
+        return message_chain
+
     async def send(self, illusts: list['Illust']) -> list[int]:
-        """发送推送"""
+        """发送推送（优先批量端点，回退流水线逐条发送）"""
         if not illusts:
             return []
-        
+
+        success_ids = None
+
+        # 优先尝试批量端点：整批 1 次 POST，限速也按批计
+        if self._batch_supported is not False and len(illusts) > 1:
+            success_ids = await self._send_batch(illusts)
+
+        if success_ids is None:
+            success_ids = await self._send_pipeline(illusts)
+
+        logger.info(f"AstrBot 推送完成: {len(success_ids)}/{len(illusts)}")
+        return success_ids
+
+    async def _send_batch(self, illusts: list['Illust']) -> list[int] | None:
+        """并发准备全部消息链后走批量端点；端点不可用时返回 None"""
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def prepare(illust):
+            async with sem:
+                return await self._build_message_chain(illust)
+
+        chains = await asyncio.gather(
+            *(prepare(illust) for illust in illusts),
+            return_exceptions=True
+        )
+
+        pairs = []
+        for illust, chain in zip(illusts, chains):
+            if isinstance(chain, BaseException):
+                logger.error(f"AstrBot 处理作品 {illust.id} 失败: {chain}")
+            else:
+                pairs.append((illust, chain))
+
+        if not pairs:
+            return []
+
+        await self._throttle()
+        results = await self._post_messages_batch([chain for _, chain in pairs])
+        if results is None:
+            # 回退逐条发送（图片缓存让重新准备几乎零开销）
+            return None
+
         success_ids = []
-        
+        for (illust, _), result in zip(pairs, results):
+            if not result:
+                continue
+            success_ids.append(illust.id)
+            if isinstance(result, dict):
+                msg_id = result.get("message_id") or result.get("msg_id")
+                if msg_id:
+                    self._message_illust_map[msg_id] = illust.id
+        return success_ids
+
+    async def _send_pipeline(self, illusts: list['Illust']) -> list[int]:
+        """
+        两级流水线发送：
+        准备工人（并发下载，压缩已在线程池）--> 有界队列 --> POST 工人。
+        下载/压缩与发送完全重叠，整体吞吐 ≈ 最慢一级的吞吐；
+        POST 端由 send_interval 全局限速，多个工人无意义，故单工。
+        """
+        prepare_q: asyncio.Queue = asyncio.Queue()
+        post_q: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
         for illust in illusts:
-            try:
-                message_chain = []
-                
-                # 1. 处理图片
-                if illust.image_urls:
-                    # 多图作品只发送封面
-                    cover_url = illust.image_urls[0]
-                    img_b64 = await self._download_and_encode_image(cover_url)
-                    
-                    if img_b64:
-                        message_chain.append({
-                            "type": "Image",
-                            "base64": img_b64
-                        })
-                    else:
-                        # 回退：使用 pixiv.cat 链接
-                        from utils import get_pixiv_cat_url
-                        cat_url = get_pixiv_cat_url(illust.id)
-                        message_chain.append({
-                            "type": "Image",
-                            "url": cat_url
-                        })
-                
-                # 2. 添加文本
-                text = self.format_message(illust)
-                message_chain.append({
-                    "type": "Plain",
-                    "text": text
-                })
-                
-                # 3. 发送
-                result = await self._post_message(message_chain)
-                
-                if result:
-                    success_ids.append(illust.id)
-                    # 如果返回了消息 ID，记录映射
-                    msg_id = result.get("message_id") or result.get("msg_id")
-                    if msg_id:
-                        self._message_illust_map[msg_id] = illust.id
-                
-                # 发送间隔
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"AstrBot 发送作品 {illust.id} 失败: {e}")
-        
-        logger.info(f"AstrBot 推送完成: {len(success_ids)}/{len(illusts)}")
+            prepare_q.put_nowait(illust)
+
+        success_ids: list[int] = []
+
+        async def prepare_worker():
+            while True:
+                try:
+                    illust = prepare_q.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    chain = await self._build_message_chain(illust)
+                    await post_q.put((illust, chain))
+                except Exception as e:
+                    logger.error(f"AstrBot 处理作品 {illust.id} 失败: {e}")
+
+        async def post_worker():
+            while True:
+                item = await post_q.get()
+                if item is None:  # 哨兵：所有准备工人已退出
+                    return
+                illust, chain = item
+                try:
+                    await self._throttle()
+                    result = await self._post_message(chain)
+                    if result:
+                        success_ids.append(illust.id)
+                        # 如果返回了消息 ID，记录映射
+                        msg_id = result.get("message_id") or result.get("msg_id")
+                        if msg_id:
+                            self._message_illust_map[msg_id] = illust.id
+                except Exception as e:
+                    logger.error(f"AstrBot 发送作品 {illust.id} 失败: {e}")
+
+        poster = asyncio.create_task(post_worker())
+        n_workers = min(self.concurrency, len(illusts))
+        await asyncio.gather(*(prepare_worker() for _ in range(n_workers)))
+        await post_q.put(None)
+        await poster
+
         return success_ids
     
     async def send_text(self, text: str, buttons: list[tuple[str, str]] | None = None) -> bool:
@@ -502,15 +502,19 @@ class PixivClient:
             logger.error(f"获取关注者新作失败: {e}")
             return []
     
+    def get_session(self) -> aiohttp.ClientSession:
+        """获取（惰性创建）共享的 aiohttp 会话，供下载与推送器复用"""
+        if self._session is None or self._session.closed:
+            from utils import create_tuned_connector
+            self._session = aiohttp.ClientSession(connector=create_tuned_connector())
+        return self._session
+
     async def download_image(self, url: str) -> bytes:
         """
         下载图片（带Referer）
         """
-        if not self._session:
-            self._session = aiohttp.ClientSession()
-        
         return await download_image_with_referer(
-            self._session,
+            self.get_session(),
             url,
             self.download_semaphore,
             proxy=self.proxy_url
@@ -86,6 +86,34 @@ def expand_search_query(tag: str) -> str:
     return expanded
 
 
+def create_tuned_connector() -> aiohttp.TCPConnector:
+    """
+    统一调优的 TCP 连接池：长连接复用省掉重复 TLS 握手（每次 100-300ms），
+    DNS 结果缓存 5 分钟。PixivClient 与各推送器共用此配置
+    """
+    return aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    )
+
+
+def install_uvloop() -> bool:
+    """
+    尝试将 uvloop 设为默认事件循环（socket 读写分发快 2-4 倍）
+    仅 Linux/macOS 可用；未安装或平台不支持时静默回退标准循环
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    logging.getLogger(__name__).info("已启用 uvloop 事件循环")
+    return True
+
+
 def setup_logging(log_dir: Path = Path("logs")):
     """配置日志（分级、文件轮转）"""
     log_dir.mkdir(exist_ok=True)
@@ -232,6 +260,38 @@ async def download_image_with_referer(
     return await _download()
 
 
+async def download_image_to_file_with_referer(
+    session: aiohttp.ClientSession,
+    url: str,
+    sink,
+    semaphore: asyncio.Semaphore | None = None,
+    proxy: str | None = None,
+    chunk_size: int = 64 * 1024
+) -> int:
+    """
+    带Referer流式下载Pixiv图片到文件对象
+    大图逐块写入 sink，不必整份驻留内存；返回写入的字节数
+    """
+    headers = {
+        "Referer": "https://www.pixiv.net/",
+        "User-Agent": "PixivIOSApp/7.13.3 (iOS 14.6; iPhone13,2)"
+    }
+
+    async def _download() -> int:
+        total = 0
+        async with session.get(url, headers=headers, proxy=proxy) as resp:
+            resp.raise_for_status()
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                sink.write(chunk)
+                total += len(chunk)
+        return total
+
+    if semaphore:
+        async with semaphore:
+            return await _download()
+    return await _download()
+
+
 # --- Tag Normalization Utilities ---
 
 import re